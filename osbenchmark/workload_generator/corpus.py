@@ -23,15 +23,27 @@
 # under the License.
 
 import bz2
+import collections
+import concurrent.futures
 import json
 import logging
 import os
 
 from osbenchmark.utils import console
 
+try:
+    # optional, considerably faster JSON encoder
+    import orjson
+except ImportError:
+    orjson = None
 
-DOCS_COMPRESSOR = bz2.BZ2Compressor
+
+DOCS_COMPRESS = bz2.compress
 COMP_EXT = ".bz2"
+# number of documents serialized into a single write, matches the default scroll page size of helpers.scan()
+WRITE_BATCH_SIZE = 1000
+# uncompressed size of each independently compressed bz2 stream, matches the block size of bzip2 -9
+COMPRESSION_BLOCK_SIZE = 900 * 1000
 
 
 def template_vars(index_name, out_path, doc_count):
@@ -85,24 +97,88 @@ def dump_documents(client, index, out_path, number_of_docs, progress_message_suf
     freq = max(1, number_of_docs // 1000)
 
     progress = console.progress()
-    compressor = DOCS_COMPRESSOR()
     comp_outpath = out_path + COMP_EXT
-    with open(out_path, "wb") as outfile:
-        with open(comp_outpath, "wb") as comp_outfile:
-            logger.info("Dumping corpus for index [%s] to [%s].", index, out_path)
-            query = {"query": {"match_all": {}}}
-            for n, doc in enumerate(helpers.scan(client, query=query, index=index)):
-                if n >= number_of_docs:
-                    break
-                data = (json.dumps(doc["_source"], separators=(",", ":")) + "\n").encode("utf-8")
+    compression_threads = os.cpu_count() or 1
+    with open(out_path, "wb") as outfile, \
+            open(comp_outpath, "wb") as comp_outfile, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=compression_threads) as pool:
+        comp_writer = ParallelCompressingWriter(comp_outfile, pool, max_pending=2 * compression_threads)
+        logger.info("Dumping corpus for index [%s] to [%s].", index, out_path)
+        query = {"query": {"match_all": {}}}
+        batch = []
+        for n, doc in enumerate(helpers.scan(client, query=query, index=index)):
+            if n >= number_of_docs:
+                break
+            batch.append(serialize_document(doc["_source"]))
+            if len(batch) == WRITE_BATCH_SIZE:
+                write_batch(outfile, comp_writer, batch)
+                batch = []
+
+            render_progress(progress, progress_message_suffix, index, n + 1, number_of_docs, freq)
+        if batch:
+            write_batch(outfile, comp_writer, batch)
+        comp_writer.close()
+    progress.finish()
 
-                outfile.write(data)
-                comp_outfile.write(compressor.compress(data))
 
-                render_progress(progress, progress_message_suffix, index, n + 1, number_of_docs, freq)
+def serialize_document(source):
+    if orjson is not None:
+        try:
+            return orjson.dumps(source, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bit, which only the stdlib encoder supports
+            pass
+    return (json.dumps(source, separators=(",", ":")) + "\n").encode("utf-8")
 
-            comp_outfile.write(compressor.flush())
-    progress.finish()
+
+def write_batch(outfile, comp_writer, batch):
+    data = b"".join(batch)
+    outfile.write(data)
+    comp_writer.write(data)
+
+
+class ParallelCompressingWriter:
+    """
+    Compresses data in blocks of ``COMPRESSION_BLOCK_SIZE`` bytes on a thread pool and writes them in order as a sequence
+    of independent bz2 streams. bz2 releases the GIL while compressing, and both ``bz2.open`` and ``pbzip2`` read
+    multi-stream files transparently.
+    """
+    def __init__(self, outfile, pool, max_pending):
+        """
+        :param outfile: Binary file object for the compressed output
+        :param pool: Executor used for compression
+        :param max_pending: Number of blocks that may be compressing at the same time before ``write`` blocks
+        """
+        self.outfile = outfile
+        self.pool = pool
+        self.max_pending = max_pending
+        self.pending = collections.deque()
+        self.block = []
+        self.block_size = 0
+        self.streams = 0
+
+    def write(self, data):
+        self.block.append(data)
+        self.block_size += len(data)
+        if self.block_size >= COMPRESSION_BLOCK_SIZE:
+            self._submit_block()
+
+    def close(self):
+        # always emit at least one stream so even an empty corpus is a valid bz2 file
+        if self.block or self.streams == 0:
+            self._submit_block()
+        self._drain(0)
+
+    def _submit_block(self):
+        self.pending.append(self.pool.submit(DOCS_COMPRESS, b"".join(self.block)))
+        self.streams += 1
+        self.block = []
+        self.block_size = 0
+        self._drain(self.max_pending)
+
+    def _drain(self, max_pending):
+        while len(self.pending) > max_pending:
+            self.outfile.write(self.pending.popleft().result())
 
 
 def render_progress(progress, progress_message_suffix, index, cur, total, freq):
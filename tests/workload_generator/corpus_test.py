@@ -21,6 +21,9 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import bz2
+import concurrent.futures
+import io
 import json
 from unittest import mock
 from unittest.mock import call
@@ -97,3 +100,76 @@ def test_extract(client, mo):
 
     file_mock = mo.return_value
     file_mock.assert_has_calls([call.write(doc_data)])
+
+
+@mock.patch("opensearchpy.helpers.scan")
+def test_dump_documents_writes_raw_and_compressed_corpus(scan, tmp_path):
+    docs = [{"id": i, "title": f"doc {i}"} for i in range(10)]
+    scan.return_value = ({"_source": doc} for doc in docs)
+    out_path = str(tmp_path / "test-documents.json")
+
+    corpus.dump_documents(mock.Mock(), "test", out_path, 8)
+
+    expected = b"".join(serialize_doc(doc) for doc in docs[:8])
+    with open(out_path, "rb") as f:
+        assert f.read() == expected
+    with bz2.open(out_path + ".bz2", "rb") as f:
+        assert f.read() == expected
+
+
+@mock.patch.object(corpus, "WRITE_BATCH_SIZE", 3)
+@mock.patch("opensearchpy.helpers.scan")
+def test_dump_documents_writes_in_batches(scan, tmp_path):
+    docs = [{"id": i} for i in range(8)]
+    scan.return_value = ({"_source": doc} for doc in docs)
+    out_path = str(tmp_path / "test-documents.json")
+    outfile = mock.mock_open()
+
+    with mock.patch("builtins.open", outfile):
+        corpus.dump_documents(mock.Mock(), "test", out_path, len(docs))
+
+    outfile.return_value.write.assert_has_calls([
+        call(b"".join(serialize_doc(doc) for doc in docs[0:3])),
+        call(b"".join(serialize_doc(doc) for doc in docs[3:6])),
+        call(b"".join(serialize_doc(doc) for doc in docs[6:8])),
+    ], any_order=True)
+
+
+def test_serialize_document():
+    doc = {"field1": "stuff", "field2": [1, 2.5, None, True]}
+
+    assert json.loads(corpus.serialize_document(doc)) == doc
+    assert corpus.serialize_document(doc).endswith(b"\n")
+    with mock.patch.object(corpus, "orjson", None):
+        assert corpus.serialize_document(doc) == serialize_doc(doc)
+
+
+def test_serialize_document_with_large_integer():
+    doc = {"counter": 2 ** 64}
+
+    assert corpus.serialize_document(doc) == serialize_doc(doc)
+
+
+@mock.patch.object(corpus, "COMPRESSION_BLOCK_SIZE", 8)
+def test_parallel_compressing_writer_preserves_order():
+    blocks = [serialize_doc({"id": i}) for i in range(20)]
+    out = io.BytesIO()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        writer = corpus.ParallelCompressingWriter(out, pool, max_pending=2)
+        for data in blocks:
+            writer.write(data)
+        writer.close()
+
+    assert writer.streams == 20
+    assert bz2.decompress(out.getvalue()) == b"".join(blocks)
+
+
+def test_parallel_compressing_writer_without_data():
+    out = io.BytesIO()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        writer = corpus.ParallelCompressingWriter(out, pool, max_pending=2)
+        writer.close()
+
+    assert bz2.decompress(out.getvalue()) == b""